@@ -19,7 +19,9 @@ setup(
     author_email='kootenpv@gmail.com',
     license='MIT',
     extras_require={
-        "all": ["keyring", "dkimpy", "premailer"],
+        "all": ["keyring", "dkimpy", "premailer", "aiosmtplib", "pybase64"],
+        "async": ["aiosmtplib"],
+        "speed": ["pybase64"],
         "dkim": ["dkimpy"],
         "test": [
             "pytest",
@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("aiosmtplib")
+
+from yagmail.async_sender import AsyncSMTP
+
+
+def _make_async_smtp():
+    return AsyncSMTP(
+        user="a@a.com",
+        smtp_skip_login=True,
+        soft_email_validation=False,
+        smtp_ssl=False,
+        smtp_starttls=False,
+    )
+
+
+def test_async_smtp_construction():
+    yag = _make_async_smtp()
+    assert yag.user == "a@a.com"
+    assert yag.smtp is None
+
+
+def test_async_smtp_rejects_sync_entry_points():
+    yag = _make_async_smtp()
+    with pytest.raises(NotImplementedError):
+        yag.send_many([])
+    with pytest.raises(NotImplementedError):
+        yag.send_unsent()
+    with pytest.raises(NotImplementedError):
+        yag.feedback()
+    with pytest.raises(TypeError):
+        with yag:
+            pass
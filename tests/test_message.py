@@ -201,3 +201,80 @@ def test_prepare_message_html_file_without_formatting_and_dkim():
         logger=logging.getLogger(),
         dnsfunc=get_txt_from_test_file
     )
+
+
+def test_prepare_message_plain_text_without_multipart():
+    user = "username@domain.com"
+    useralias = "John Doe"
+    addresses = {
+        "To": "dest@other.domain.com",
+    }
+    subject = "fake-subject"
+    contents = "Hello World"
+    attachments = None
+    headers = None
+    encoding = "utf-8"
+
+    msg = prepare_message(
+        user,
+        useralias,
+        addresses,
+        subject,
+        contents,
+        attachments,
+        headers,
+        encoding,
+    )
+
+    # a plain text body without attachments or extra headers should not
+    # grow a multipart wrapper
+    assert not msg.is_multipart()
+    assert msg.get_content_type() == "text/plain"
+    assert msg["Subject"] == subject
+    assert msg["To"] == addresses["To"]
+    assert msg.get_payload(decode=True).decode() == contents
+
+
+def test_prepare_message_file_path_contents_attaches_file(tmp_path):
+    user = "username@domain.com"
+    useralias = "John Doe"
+    addresses = {
+        "To": "dest@other.domain.com",
+    }
+    subject = "fake-subject"
+    attachment = tmp_path / "report.txt"
+    attachment.write_text("file contents")
+    contents = str(attachment)
+    headers = None
+    encoding = "utf-8"
+
+    msg = prepare_message(
+        user,
+        useralias,
+        addresses,
+        subject,
+        contents,
+        None,
+        headers,
+        encoding,
+    )
+
+    # a path to an existing file is attached, not sent as the literal body
+    assert msg.is_multipart()
+    attached = [part for part in msg.walk() if part.get_filename() == "report.txt"]
+    assert len(attached) == 1
+    assert attached[0].get_payload(decode=True) == b"file contents"
+
+
+def test_stream_b64_payload_text_handle_with_multibyte_char():
+    import base64
+    import io
+
+    from yagmail.message import stream_b64_payload
+
+    # the multibyte char makes chunk byte counts a non-multiple of 3,
+    # which must not emit base64 padding mid-stream
+    text = "é" + "a" * (57 * 1024 * 2)
+    encoded = stream_b64_payload(io.StringIO(text))
+
+    assert base64.b64decode(encoded.replace("\n", ""), validate=True) == text.encode()
@@ -49,3 +49,88 @@ def test_send(combination, smtpd):
     print(yag.send(
         **combination
     ))
+
+
+def test_send_many(smtpd):
+    yag = SMTP(
+        host=smtpd.hostname,
+        port=smtpd.port,
+        smtp_skip_login=True,
+        soft_email_validation=False,
+        smtp_ssl=False,
+        smtp_starttls=False,
+    )
+
+    results = yag.send_many([
+        {"to": user_name, "subject": "subj", "contents": "body"},
+        (user_name, "subj1", "body1", None),
+    ])
+
+    assert len(results) == 2
+    assert len(smtpd.messages) == 2
+
+
+def test_send_fast_text_path(smtpd):
+    yag = SMTP(
+        host=smtpd.hostname,
+        port=smtpd.port,
+        smtp_skip_login=True,
+        soft_email_validation=False,
+        smtp_ssl=False,
+        smtp_starttls=False,
+    )
+
+    result, msg_string = yag.send(to=user_name, subject="subj", contents="plain body")
+
+    # the fast path bypasses MIME construction and returns the raw string
+    assert isinstance(msg_string, str)
+    assert "Content-Type: text/plain" in msg_string
+    assert len(smtpd.messages) == 1
+    assert smtpd.messages[0]["Subject"] == "subj"
+    assert smtpd.messages[0]["Message-ID"]
+
+
+def test_send_file_path_contents_skips_fast_path(smtpd, tmp_path):
+    attachment = tmp_path / "report.txt"
+    attachment.write_text("file contents")
+
+    yag = SMTP(
+        host=smtpd.hostname,
+        port=smtpd.port,
+        smtp_skip_login=True,
+        soft_email_validation=False,
+        smtp_ssl=False,
+        smtp_starttls=False,
+    )
+
+    yag.send(to=user_name, subject="subj", contents=str(attachment))
+
+    # a string that is a path to an existing file must be attached, not
+    # shipped as the literal body
+    assert len(smtpd.messages) == 1
+    received = smtpd.messages[0]
+    assert received.is_multipart()
+    filenames = [part.get_filename() for part in received.walk()]
+    assert "report.txt" in filenames
+
+
+def test_send_many_reuses_serialized_body(smtpd):
+    yag = SMTP(
+        host=smtpd.hostname,
+        port=smtpd.port,
+        smtp_skip_login=True,
+        soft_email_validation=False,
+        smtp_ssl=False,
+        smtp_starttls=False,
+    )
+
+    results = yag.send_many([
+        {"to": "a@a.com", "subject": "subj", "contents": ["same body"]},
+        {"to": "b@b.com", "subject": "subj", "contents": ["same body"]},
+    ])
+
+    assert len(results) == 2
+    assert [m["To"] for m in smtpd.messages] == ["a@a.com", "b@b.com"]
+    # the reused serialization must not duplicate the Message-ID
+    message_ids = [m["Message-ID"] for m in smtpd.messages]
+    assert len(set(message_ids)) == 2
@@ -0,0 +1,144 @@
+"""
+Asynchronous counterpart to :class:`yagmail.SMTP`, built on ``aiosmtplib``.
+
+A synchronous SMTP socket serializes all sends. With independent async
+sessions (e.g. fanning out to several hosts) the TCP/TLS handshakes and
+per-message round-trips overlap, while the compute-bound message
+preparation is reused unchanged from the synchronous implementation.
+
+Requires the optional ``aiosmtplib`` dependency::
+
+    pip install aiosmtplib
+"""
+
+import asyncio
+
+import aiosmtplib
+
+from yagmail.sender import SMTP
+
+
+class AsyncSMTP(SMTP):
+    """ Async variant of :class:`yagmail.SMTP`: `login`, `send` and `close`
+    are coroutines and the connection is an ``aiosmtplib.SMTP``. Use it as an
+    async context manager, or make sure to await `close` yourself. """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if not self.is_closed:
+            await self.close()
+        return False
+
+    # the synchronous entry points inherited from SMTP would "succeed" without
+    # ever awaiting the aiosmtplib coroutines (and thus send nothing), so they
+    # fail loudly instead
+
+    def __enter__(self):
+        raise TypeError("AsyncSMTP must be used with 'async with'")
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        raise TypeError("AsyncSMTP must be used with 'async with'")
+
+    def send_many(self, jobs, per_conn_limit=100):
+        raise NotImplementedError(
+            "send_many is synchronous; gather send() coroutines or use send_all instead"
+        )
+
+    def send_unsent(self):
+        raise NotImplementedError("send_unsent is synchronous and not supported by AsyncSMTP")
+
+    def feedback(self, message="Awesome features! You made my day! How can I contribute?"):
+        raise NotImplementedError("feedback is synchronous; await send() instead")
+
+    async def login(self):
+        if self.oauth2_file is not None:
+            raise NotImplementedError("oauth2 login is not supported by AsyncSMTP")
+        self.smtp = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=int(self.port),
+            use_tls=self.ssl,
+            start_tls=bool(self.starttls),
+            **self.kwargs
+        )
+        await self.smtp.connect()
+        self.is_closed = False
+        if not self.smtp_skip_login:
+            password = self.handle_password(self.user, self.credentials)
+            await self.smtp.login(self.user, password)
+        self.log.info("Connected to SMTP @ %s:%s as %s", self.host, self.port, self.user)
+
+    async def _ensure_alive(self):
+        try:
+            response = await self.smtp.noop()
+            code = response.code
+        except (AttributeError, aiosmtplib.errors.SMTPException, OSError):
+            code = None
+        if code != 250:
+            await self.login()
+
+    async def send(
+        self,
+        to=None,
+        subject=None,
+        contents=None,
+        attachments=None,
+        cc=None,
+        bcc=None,
+        preview_only=False,
+        headers=None,
+        prettify_html=True,
+        message_id=None,
+        group_messages=True,
+        text_only_without_formatting=False,
+    ):
+        """ Use this to send an email without blocking the event loop """
+        await self._ensure_alive()
+
+        recipients, msg = self.prepare_send(
+            to,
+            subject,
+            contents,
+            attachments,
+            cc,
+            bcc,
+            headers,
+            prettify_html,
+            message_id,
+            group_messages,
+            text_only_without_formatting,
+        )
+
+        if preview_only:
+            return recipients, msg
+
+        errors, _ = await self.smtp.sendmail(self.user, recipients, msg.as_string())
+        self.log.info("Message sent to %s", recipients)
+        self.num_mail_sent += 1
+        return errors, msg
+
+    async def close(self):
+        """ Close the connection to the SMTP server """
+        self.is_closed = True
+        try:
+            await self.smtp.quit()
+        except (TypeError, AttributeError, aiosmtplib.errors.SMTPException, OSError):
+            pass
+
+    def __del__(self):
+        # a destructor cannot await the QUIT round-trip; just drop the transport
+        try:
+            if not self.is_closed and self.smtp is not None:
+                self.smtp.close()
+        except Exception:
+            pass
+
+
+async def send_all(jobs):
+    """
+    Send over several connections concurrently. `jobs` is an iterable of
+    ``(AsyncSMTP, send_kwargs)`` pairs; sessions to different hosts overlap
+    their handshakes and round-trips via ``asyncio.gather``.
+    """
+    return await asyncio.gather(*[conn.send(**kwargs) for conn, kwargs in jobs])
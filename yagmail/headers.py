@@ -1,6 +1,7 @@
 import time
 import random
 import hashlib
+from email.utils import formataddr
 from email.utils import parseaddr
 
 from yagmail.compat import text_type
@@ -35,20 +36,54 @@ def make_addr_alias_user(email_addr):
     return email, name
 
 
+def _add_str_target(x, addresses, which):
+    addresses["recipients"].append(x)
+    addresses[which] = x
+
+
+def _add_seq_target(x, addresses, which):
+    if not all([isinstance(k, text_type) for k in x]):
+        raise YagAddressError
+    addresses["recipients"].extend(x)
+    addresses[which] = ", ".join(x)
+
+
+def _add_dict_target(x, addresses, which):
+    addresses["recipients"].extend(x.keys())
+    addresses[which] = ", ".join(
+        _format_addr_alias(addr, alias) for addr, alias in x.items()
+    )
+
+
+# one exact-type probe per recipient group instead of a serial isinstance chain
+_TARGET_DISPATCH = {
+    str: _add_str_target,
+    list: _add_seq_target,
+    tuple: _add_seq_target,
+    dict: _add_dict_target,
+}
+
+
 def make_addr_alias_target(x, addresses, which):
-    if isinstance(x, text_type):
-        addresses["recipients"].append(x)
-        addresses[which] = x
-    elif isinstance(x, list) or isinstance(x, tuple):
-        if not all([isinstance(k, text_type) for k in x]):
+    handler = _TARGET_DISPATCH.get(type(x))
+    if handler is None:
+        # subclasses (e.g. ``raw``) miss the exact-type probe;
+        # resolve them once and memoize the concrete type
+        for klass, klass_handler in list(_TARGET_DISPATCH.items()):
+            if isinstance(x, klass):
+                handler = _TARGET_DISPATCH[type(x)] = klass_handler
+                break
+        else:
             raise YagAddressError
-        addresses["recipients"].extend(x)
-        addresses[which] = ",".join(x)
-    elif isinstance(x, dict):
-        addresses["recipients"].extend(x.keys())
-        addresses[which] = ",".join(x.values())
-    else:
-        raise YagAddressError
+    handler(x, addresses, which)
+
+
+def _format_addr_alias(addr, alias):
+    """ RFC-escape a {email: alias} pair into 'alias <email>'; aliases that are
+    already fully formatted addresses pass through untouched """
+    if parseaddr(alias)[1] == addr:
+        return alias
+    return formataddr((alias, addr))
 
 
 def add_subject(msg, subject):
@@ -71,11 +106,18 @@ def add_recipients_headers(user, useralias, msg, addresses):
         msg["Cc"] = addresses["Cc"]
 
 
-def add_message_id(msg, message_id=None, group_messages=True):
+def make_message_id(frm, to, subject, message_id=None, group_messages=True):
+    """ Build the Message-ID header value without needing a Message object """
     if message_id is None:
         if group_messages:
-            addr = " ".join(sorted([msg["From"], msg["To"]])) + msg.get("Subject", "None")
+            addr = " ".join(sorted([frm, to])) + subject
         else:
             addr = str(time.time() + random.random())
         message_id = "<" + hashlib.md5(addr.encode()).hexdigest() + "@pp>"
-    msg["Message-ID"] = message_id
+    return message_id
+
+
+def add_message_id(msg, message_id=None, group_messages=True):
+    msg["Message-ID"] = make_message_id(
+        msg["From"], msg["To"], msg.get("Subject", "None"), message_id, group_messages
+    )
@@ -1,10 +1,11 @@
 import datetime
-import email.encoders
 import io
 import json
 import mimetypes
 import os
+import re
 import sys
+from functools import lru_cache
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -16,14 +17,65 @@ from yagmail.headers import add_recipients_headers
 from yagmail.headers import add_subject
 from yagmail.utils import raw, inline
 
+try:
+    # SIMD-accelerated base64 (libbase64 with AVX2/AVX-512 dispatch), ~4x
+    # faster than the stdlib scalar loop on large attachments
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
 PY3 = sys.version_info[0] > 2
 
+# cheap scan for markup ('<' followed by a tag-ish name); orders of magnitude
+# cheaper than a real parse and good enough to route text/plain vs text/html
+HTML_SNIFF = re.compile(r"<[a-zA-Z!][a-zA-Z0-9-]*[\s/>]")
+
+# pay the lazy mimetypes-database initialization once at import instead of
+# on the first attachment
+mimetypes.init()
+
+
+@lru_cache(maxsize=256)
+def _classify_path(path):
+    """ Cached basename + mimetype guess; both are pure functions of the path,
+    unlike isfile, which must be re-checked every time """
+    return os.path.basename(path), mimetypes.guess_type(path)
+
 
 def dt_converter(o):
     if isinstance(o, (datetime.date, datetime.datetime)):
         return o.isoformat()
 
 
+def stream_b64_payload(binary_file):
+    """ Base64-encode a file in chunks, so the raw file is never held in
+    memory whole; the encoded payload is still materialized in full, since
+    set_payload needs all of it anyway. """
+    lines = []
+    # a multiple of 57 raw bytes keeps every emitted line within the 76 char limit
+    chunk_size = 57 * 1024
+    pending = b""
+    while True:
+        chunk = binary_file.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, str):
+            # text-mode handles may yield byte counts that are not a multiple
+            # of 3 (multibyte characters), which would emit '=' padding
+            # mid-stream; carry the remainder into the next chunk instead
+            chunk = chunk.encode()
+        pending += chunk
+        cut = len(pending) - len(pending) % 3
+        b64 = b64encode(pending[:cut]).decode("ascii")
+        pending = pending[cut:]
+        for i in range(0, len(b64), 76):
+            lines.append(b64[i:i + 76])
+    if pending:
+        lines.append(b64encode(pending).decode("ascii"))
+    lines.append("")
+    return "\n".join(lines)
+
+
 def serialize_object(content):
     is_marked_up = False
     if isinstance(content, (dict, list, tuple, set)):
@@ -68,6 +120,25 @@ def prepare_message(
 
         return msg
 
+    if (
+        attachments is None
+        and headers is None
+        and dkim is None
+        and isinstance(contents, str)
+        and not HTML_SNIFF.search(contents)
+        # a string naming an existing file must take the attachment path below
+        and "\x00" not in contents
+        and not os.path.isfile(contents)
+    ):
+        # plain text only: a flat MIMEText avoids two MIMEMultipart objects,
+        # their boundary generation and the extra generator tree walks
+        msg = MIMEText(contents, _charset=encoding)
+        msg["Date"] = formatdate()
+        add_subject(msg, subject)
+        add_recipients_headers(user, useralias, msg, addresses)
+        add_message_id(msg, message_id, group_messages)
+        return msg
+
     if not isinstance(contents, (list, tuple)):
         if contents is not None:
             contents = [contents]
@@ -115,18 +186,10 @@ def prepare_message(
     if contents is not None:
         for content_object, content_string in zip(content_objects, contents):
             if content_object["main_type"] == "image":
-                # all image objects need base64 encoding, so do it now
-                email.encoders.encode_base64(content_object["mime_object"])
-                # aliased image {'path' : 'alias'}
-                if isinstance(content_string, dict) and len(content_string) == 1:
-                    for key in content_string:
-                        hashed_ref = str(abs(hash(key)))
-                        alias = content_string[key]
-                    # pylint: disable=undefined-loop-variable
-                    content_string = key
-                else:
-                    alias = os.path.basename(str(content_string))
-                    hashed_ref = str(abs(hash(alias)))
+                # image objects come out of get_mime_object already base64-encoded,
+                # with their content id and alias precomputed in prepare_contents
+                hashed_ref = content_object["cid"]
+                alias = content_object["alias"]
 
                 # TODO: I should probably remove inline now that there is "attachments"
                 # if string is `inline`, inline, else, attach
@@ -145,7 +208,6 @@ def prepare_message(
 
             else:
                 if content_object["encoding"] == "base64":
-                    email.encoders.encode_base64(content_object["mime_object"])
                     msg.attach(content_object["mime_object"])
                 elif content_object["sub_type"] not in ["html", "plain"]:
                     msg.attach(content_object["mime_object"])
@@ -188,6 +250,16 @@ def prepare_contents(contents, encoding):
             content_object = get_mime_object(is_marked_up, content, encoding)
             if content_object["main_type"] == "image":
                 has_included_images = True
+                # compute the content id and alias here, once per content,
+                # instead of re-hashing inside the message assembly loop
+                if isinstance(content, dict) and len(content) == 1:
+                    # aliased image {'path' : 'alias'}
+                    ((path, alias),) = content.items()
+                    content_object["cid"] = str(abs(hash(path)))
+                else:
+                    alias = os.path.basename(str(content))
+                    content_object["cid"] = str(abs(hash(alias)))
+                content_object["alias"] = alias
             mime_objects.append(content_object)
     return has_included_images, mime_objects
 
@@ -199,28 +271,29 @@ def get_mime_object(is_marked_up, content_string, encoding):
         "main_type": None,
         "sub_type": None,
         "is_marked_up": is_marked_up,
+        "cid": None,
+        "alias": None,
     }
-    try:
-        content_name = os.path.basename(str(content_string))
-    except UnicodeEncodeError:
-        content_name = os.path.basename(content_string)
     # pylint: disable=unidiomatic-typecheck
     is_raw = type(content_string) == raw
+    guessed_type = (None, None)
     try:
-        is_file = os.path.isfile(content_string)
+        path = str(content_string)
+        is_file = os.path.isfile(path)
+        # don't let huge message bodies pin memory in the cache
+        classify = _classify_path if len(path) < 1024 else _classify_path.__wrapped__
+        content_name, guessed_type = classify(path)
     except ValueError:
+        # e.g. embedded null byte
         is_file = False
         content_name = str(abs(hash(content_string)))
-    except TypeError:
-        # This happens when e.g. tuple is passed.
-        is_file = False
     if not is_raw and is_file:
         with open(content_string, "rb") as f:
             content_object["encoding"] = "base64"
-            content = f.read()
+            content = stream_b64_payload(f)
 
     elif isinstance(content_string, io.IOBase):
-        content = content_string.read()
+        content = stream_b64_payload(content_string)
         # no need to except AttributeError, as we set missing name attributes in the `prepare_contents` function
         content_name = os.path.basename(content_string.name)
         content_object["encoding"] = "base64"
@@ -230,9 +303,11 @@ def get_mime_object(is_marked_up, content_string, encoding):
 
         if is_raw:
             content_object["mime_object"] = MIMEText(content_string, _charset=encoding)
-        else:
+        elif HTML_SNIFF.search(content_string):
             content_object["mime_object"] = MIMEText(content_string, "html", _charset=encoding)
             content_object["sub_type"] = "html"
+        else:
+            content_object["mime_object"] = MIMEText(content_string, _charset=encoding)
 
         if content_object["sub_type"] is None:
             content_object["sub_type"] = "plain"
@@ -240,7 +315,10 @@ def get_mime_object(is_marked_up, content_string, encoding):
 
     if content_object["main_type"] is None:
         # Guess the mimetype with the filename
-        content_type, _ = mimetypes.guess_type(content_name)
+        if isinstance(content_string, io.IOBase):
+            # the classified path was the repr of the IO object, not its name
+            guessed_type = mimetypes.guess_type(content_name)
+        content_type, _ = guessed_type
 
         if content_type is not None:
             content_object["main_type"], content_object["sub_type"] = content_type.split("/")
@@ -254,6 +332,8 @@ def get_mime_object(is_marked_up, content_string, encoding):
         content_object["main_type"], content_object["sub_type"], name=(encoding, '', content_name)
     )
     mime_object.set_payload(content)
+    if content_object["encoding"] == "base64":
+        mime_object["Content-Transfer-Encoding"] = "base64"
     if content_object["main_type"] == "application":
         mime_object.add_header('Content-Disposition', 'attachment', filename=content_name)
     content_object["mime_object"] = mime_object
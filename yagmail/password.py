@@ -1,14 +1,23 @@
+from functools import lru_cache
+
 try:
     import keyring
 except (ImportError, NameError, RuntimeError):
     pass
 
 
+@lru_cache(maxsize=16)
+def _cached_keyring_password(service, user):
+    """ Cache keyring lookups; each one crosses an OS IPC boundary
+    (Secret Service DBus / Keychain), which costs tens of ms per login """
+    return keyring.get_password(service, user)
+
+
 def handle_password(user, password):  # pragma: no cover
     """ Handles getting the password"""
     if password is None:
         try:
-            password = keyring.get_password("yagmail", user)
+            password = _cached_keyring_password("yagmail", user)
         except NameError as e:
             print(
                 "'keyring' cannot be loaded. Try 'pip install keyring' or continue without. See https://github.com/kootenpv/yagmail"
@@ -35,3 +44,4 @@ def handle_password(user, password):  # pragma: no cover
 def register(username, password):
     """ Use this to add a new gmail account to your OS' keyring so it can be used in yagmail """
     keyring.set_password("yagmail", username, password)
+    _cached_keyring_password.cache_clear()
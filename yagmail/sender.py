@@ -1,21 +1,33 @@
 # when there is a bcc a different message has to be sent to the bcc
 # person, to show that they are bcc'ed
 
+import os
 import time
 import logging
 import smtplib
 from typing import List, Tuple, Union
 
 from email.message import Message
+from email.utils import formatdate
 
 from yagmail.log import get_logger
 from yagmail.utils import find_user_home_path
 from yagmail.oauth2 import get_oauth2_info, get_oauth_string
 from yagmail.headers import resolve_addresses
-from yagmail.validate import validate_email_with_regex
+from yagmail.validate import validate_email_with_regex, validate_emails_with_regex
 from yagmail.password import handle_password
-from yagmail.message import prepare_message
+from yagmail.message import prepare_message, HTML_SNIFF
 from yagmail.headers import make_addr_alias_user
+from yagmail.headers import make_message_id
+
+
+def _is_ascii(text):
+    # str.isascii() needs 3.7+, and 3.6 is still in the support matrix
+    try:
+        text.encode("ascii")
+        return True
+    except UnicodeEncodeError:
+        return False
 
 
 class SMTP:
@@ -50,6 +62,12 @@ class SMTP:
         elif user is None:
             user = find_user_home_path()
         self.user, self.useralias = make_addr_alias_user(user)
+        if self.user and "@" not in self.user:
+            # a bare username is taken to be a gmail account; normalize it once
+            # here so relogins and headers always agree on the same address
+            if self.useralias == self.user:
+                self.useralias += "@gmail.com"
+            self.user += "@gmail.com"
         if soft_email_validation:
             validate_email_with_regex(self.user)
         self.is_closed = None
@@ -121,8 +139,7 @@ class SMTP:
         addresses = resolve_addresses(self.user, self.useralias, to, cc, bcc)
 
         if self.soft_email_validation:
-            for email_addr in addresses["recipients"]:
-                validate_email_with_regex(email_addr)
+            validate_emails_with_regex(addresses["recipients"])
 
         msg = prepare_message(
             self.user,
@@ -160,7 +177,31 @@ class SMTP:
         text_only_without_formatting=False,
     ) -> Union[Tuple[bool, Message], Tuple[List[str], Message]]:
         """ Use this to send an email with gmail"""
-        self.login()
+        self._ensure_alive()
+
+        if (
+            not preview_only
+            and attachments is None
+            and cc is None
+            and bcc is None
+            and headers is None
+            and message_id is None
+            and self.dkim is None
+            and not text_only_without_formatting
+            and isinstance(to, str)
+            and (subject is None or isinstance(subject, str))
+            and isinstance(contents, str)
+            and not HTML_SNIFF.search(contents)
+            and _is_ascii("{0}{1}{2}".format(to, subject, contents))
+            # path-like contents (including the inline marker) must go through
+            # the MIME path, which reads and attaches the file
+            and "\x00" not in contents
+            and not os.path.isfile(contents)
+        ):
+            if self.soft_email_validation:
+                validate_email_with_regex(to)
+            msg_string = self._fast_text_message(to, subject, contents, group_messages)
+            return self._attempt_send([to], msg_string), msg_string
 
         recipients, msg = self.prepare_send(
             to,
@@ -181,11 +222,119 @@ class SMTP:
 
         return self._attempt_send(recipients, msg), msg
 
-    def _attempt_send(self, recipients: List[str], msg: Message) -> bool:
-        msg_string = msg.as_string()
+    def send_many(self, jobs, per_conn_limit=100) -> List[Union[bool, dict]]:
+        """
+        Send a batch of emails over a single SMTP session. `jobs` is an iterable
+        of either dicts with :meth:`prepare_send` keyword arguments (so no
+        `preview_only`) or ``(to, subject, contents, attachments)`` tuples.
+        All messages are prepared
+        up front, the envelope is reset with `RSET` between sends, and the
+        connection is recycled every `per_conn_limit` messages to stay below
+        provider per-connection caps.
+        """
+        jobs = [job if isinstance(job, dict) else dict(zip(("to", "subject", "contents", "attachments"), job)) for job in jobs]
+        prepared = []
+        previous = None
+        for job in jobs:
+            simple = isinstance(job.get("to"), str) and set(job) <= {"to", "subject", "contents"}
+            if (
+                simple
+                and previous is not None
+                and self.dkim is None
+                and {k: v for k, v in job.items() if k != "to"}
+                == {k: v for k, v in previous[0].items() if k != "to"}
+            ):
+                # same body and subject as the previous job: reuse its serialized
+                # form and only swap the To and Message-ID headers instead of
+                # rebuilding the MIME tree and rerunning the generator
+                rewritten = self._replace_header(previous[1], "To", job["to"])
+                if rewritten is not None:
+                    subject = job.get("subject")
+                    if isinstance(subject, list):
+                        subject = " ".join(subject)
+                    message_id = make_message_id(
+                        self._from_header(), job["to"], subject if subject else "None"
+                    )
+                    rewritten = self._replace_header(rewritten, "Message-ID", message_id)
+                if rewritten is not None:
+                    if self.soft_email_validation:
+                        validate_email_with_regex(job["to"])
+                    prepared.append(([job["to"]], rewritten))
+                    continue
+            recipients, msg = self.prepare_send(**job)
+            msg_string = msg.as_string()
+            prepared.append((recipients, msg_string))
+            previous = (job, msg_string) if simple else None
+        self._ensure_alive()
+        results = []
+        for num_sent, (recipients, msg) in enumerate(prepared):
+            if num_sent and num_sent % per_conn_limit == 0:
+                self.close()
+                self.login()
+            results.append(self._attempt_send(recipients, msg))
+            try:
+                self.smtp.rset()
+            except smtplib.SMTPException:
+                pass
+        return results
+
+    @staticmethod
+    def _replace_header(msg_string: str, name: str, value: str) -> Union[str, None]:
+        """ Swap a single header line of an already serialized message;
+        returns None when the header cannot be located safely """
+        head, sep, rest = msg_string.partition("\n{0}: ".format(name))
+        if not sep or "\n\n" in head:
+            return None
+        newline = rest.find("\n")
+        if newline == -1:
+            return None
+        return head + sep + value + rest[newline:]
+
+    _TEXT_TEMPLATE = (
+        "From: {frm}\r\nTo: {to}\r\nSubject: {subject}\r\nDate: {date}\r\n"
+        "Message-ID: {message_id}\r\n"
+        "MIME-Version: 1.0\r\nContent-Type: text/plain; charset=utf-8\r\n\r\n{body}"
+    )
+
+    def _fast_text_message(self, to, subject, body, group_messages=True) -> str:
+        """
+        Format a simple plain-text message from a template, skipping the (slow)
+        `email.mime` construction and serialization entirely. Only used for the
+        hot path of ascii text without attachments or extra headers.
+        """
+        frm = self._from_header()
+        message_id = make_message_id(
+            frm, to, subject if subject is not None else "None", group_messages=group_messages
+        )
+        return self._TEXT_TEMPLATE.format(
+            frm=frm, to=to, subject=subject or "", date=formatdate(), message_id=message_id, body=body
+        )
+
+    def _from_header(self) -> str:
+        return '"{0}" <{1}>'.format(
+            self.useralias.replace("\\", "\\\\").replace('"', '\\"'), self.user
+        )
+
+    def _ensure_alive(self):
+        """
+        Probe the current SMTP connection with a `NOOP` and lazily (re)login when the
+        connection turns out to be gone or stale. This keeps a single session alive
+        across `send` calls instead of paying the connect/STARTTLS/login latency
+        for every message.
+        """
+        try:
+            code, _ = self.smtp.noop()
+        except (AttributeError, smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException, OSError):
+            code = None
+        if code != 250:
+            self.login()
+
+    def _attempt_send(self, recipients: List[str], msg: Union[Message, str]) -> bool:
+        msg_string = msg if isinstance(msg, str) else msg.as_string()
         attempts = 0
         while attempts < 3:
             try:
+                self._ensure_alive()
                 result = self.smtp.sendmail(self.user, recipients, msg_string)
                 self.log.info("Message sent to %s", recipients)
                 self.num_mail_sent += 1
@@ -193,7 +342,7 @@ class SMTP:
             except smtplib.SMTPServerDisconnected as e:
                 self.log.error(e)
                 attempts += 1
-                time.sleep(attempts * 3)
+                time.sleep(min(0.5 * 2 ** attempts, 5))
         self.unsent.append((recipients, msg_string))
         return False
 
@@ -202,16 +351,23 @@ class SMTP:
         Emails that were not being able to send will be stored in :attr:`self.unsent`.
         Use this function to attempt to send these again
         """
-        for i in range(len(self.unsent)):
-            recipients, msg_string = self.unsent.pop(i)
+        # drain in one swap: popping at an index while iterating both skips
+        # entries and is quadratic; messages failing again are re-appended
+        # in order by _attempt_send
+        pending, self.unsent = self.unsent, []
+        for recipients, msg_string in pending:
             self._attempt_send(recipients, msg_string)
 
     def close(self):
         """ Close the connection to the SMTP server """
-        self.is_closed = True
+        was_closed, self.is_closed = self.is_closed, True
         try:
-            self.smtp.quit()
-        except (TypeError, AttributeError, smtplib.SMTPServerDisconnected):
+            if was_closed:
+                # QUIT already happened; just release the socket
+                self.smtp.close()
+            else:
+                self.smtp.quit()
+        except (TypeError, AttributeError, smtplib.SMTPServerDisconnected, OSError):
             pass
 
     def login(self):
@@ -237,6 +393,9 @@ class SMTP:
         self.is_closed = False
         if not self.smtp_skip_login:
             password = self.handle_password(self.user, password)
+            # remember the resolved credential so relogins skip the keyring
+            # round trip (and any interactive prompt) entirely
+            self.credentials = password
             self.smtp.login(self.user, password)
         self.log.info("Connected to SMTP @ %s:%s as %s", self.host, self.port, self.user)
 
@@ -267,8 +426,10 @@ class SMTP:
         self.send("kootenpv@gmail.com", "Yagmail feedback", message)
 
     def __del__(self):
+        # during interpreter shutdown smtplib may be half torn down; anything
+        # raised (or logged) here can stall finalization, so swallow it all
         try:
             if not self.is_closed:
                 self.close()
-        except AttributeError:
+        except Exception:
             pass
@@ -96,6 +96,10 @@ ADDR_SPEC = LOCAL_PART + r'@' + DOMAIN               # see 3.4.1
 # A valid address will match exactly the 3.4.1 addr-spec.
 VALID_ADDRESS_REGEXP = '^' + ADDR_SPEC + '$'
 
+# compiled once at import time; the pattern is huge and recompiling (or even
+# hitting the re cache) per recipient adds up on large recipient lists
+VALID_ADDRESS_RE = re.compile(VALID_ADDRESS_REGEXP)
+
 
 def validate_email_with_regex(email_address):
     """
@@ -104,10 +108,26 @@ def validate_email_with_regex(email_address):
     However, it could still very well be that the actual emailaddress has simply
     not be claimed by anyone (so then this function fails to devalidate).
     """
-    if not re.match(VALID_ADDRESS_REGEXP, email_address):
+    if not VALID_ADDRESS_RE.match(email_address):
         emsg = 'Emailaddress "{}" is not valid according to RFC 2822 standards'.format(
             email_address)
         raise YagInvalidEmailAddress(emsg)
     # apart from the standard, I personally do not trust email addresses without dot.
     if "." not in email_address and "localhost" not in email_address.lower():
         raise YagInvalidEmailAddress("Missing dot in emailaddress")
+
+
+def validate_emails_with_regex(email_addresses):
+    """ Validate a whole recipient list in one pass, collecting every invalid
+    address before raising, instead of paying a function call plus try/except
+    per address in the caller's loop. """
+    invalid = [
+        email_address
+        for email_address in email_addresses
+        if not VALID_ADDRESS_RE.match(email_address)
+        or ("." not in email_address and "localhost" not in email_address.lower())
+    ]
+    if invalid:
+        emsg = 'Emailaddresses {} are not valid according to RFC 2822 standards'.format(
+            ", ".join('"{}"'.format(x) for x in invalid))
+        raise YagInvalidEmailAddress(emsg)